@@ -1,2 +1,17 @@
-from .core import class_property,cached_class_property,threadsafe_cached_class_property
-__all__=["class_property","cached_class_property","threadsafe_cached_class_property"]
+from .core import (
+    cached_class_property,
+    class_property,
+    freeze_cached_properties,
+    freeze_cached_properties_strict,
+    single_thread_cached_class_property,
+    threadsafe_cached_class_property,
+)
+
+__all__ = [
+    'class_property',
+    'cached_class_property',
+    'single_thread_cached_class_property',
+    'threadsafe_cached_class_property',
+    'freeze_cached_properties',
+    'freeze_cached_properties_strict',
+]
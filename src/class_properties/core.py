@@ -1,11 +1,56 @@
 from __future__ import annotations
 
+import dis
+import sys
 import threading
+from functools import wraps
+from operator import attrgetter
+from types import FunctionType
 from typing import Generic, TypeVar
 
 T = TypeVar('T')
 R = TypeVar('R')
 
+_MISSING = object()
+
+_CACHE_NAME_PREFIX = '__cachedclassprop_'
+
+# Error message templates, formatted with the getter's qualified name.
+_NO_OWNER_MSG = "class property '{}' accessed with no owner"
+_READ_ONLY_MSG = "class property '{}' is read-only"
+_SET_ON_CLASS_MSG = (
+    "cached_class_property '{}' cannot be set on the class; set it via an instance or explicit API instead"
+)
+_DELETE_ON_CLASS_MSG = (
+    "cached_class_property '{}' cannot be deleted on the class; delete it via an instance or explicit API instead"
+)
+
+
+# Opcodes that may load the getter's first argument, across supported CPython versions.
+_LOAD_FAST_OPS = frozenset({'LOAD_FAST', 'LOAD_FAST_BORROW'})
+
+
+def _attrgetter_for(fget):
+    """Return an equivalent ``operator.attrgetter`` if ``fget`` is exactly ``return cls.<attr>``, otherwise ``None``.
+
+    Calling the C-level attrgetter avoids pushing a Python frame for such trivial getters.
+    """
+    if type(fget) is not FunctionType:
+        return None
+    code = fget.__code__
+    if code.co_argcount < 1:
+        return None
+    ops = [i for i in dis.get_instructions(code) if i.opname not in ('RESUME', 'NOP')]
+    if (
+        len(ops) == 3
+        and ops[0].opname in _LOAD_FAST_OPS
+        and ops[0].argval == code.co_varnames[0]
+        and ops[1].opname == 'LOAD_ATTR'
+        and ops[2].opname == 'RETURN_VALUE'
+    ):
+        return attrgetter(ops[1].argval)
+    return None
+
 
 class class_property(Generic[R]):
     """Read-only, class-level analogue of @property.
@@ -34,33 +79,46 @@ class class_property(Generic[R]):
           this descriptor entirely at the language level and is unsupported.
     """
 
-    __slots__ = ('fget', '__doc__', 'name')
+    __slots__ = ('_fget', '_getter', '_doc')
 
     def __init__(self, fget, doc=None):
         if fget is None:
             raise TypeError('fget must not be None')
         self.fget = fget
-        self.__doc__ = doc or getattr(fget, '__doc__', None)
-        self.name: str | None = None
+        self._doc = doc or getattr(fget, '__doc__', None)
+
+    @property
+    def fget(self):
+        return self._fget
 
-    def __set_name__(self, owner, name):
-        self.name = name
+    @fget.setter
+    def fget(self, fget):
+        # Keep the (possibly specialized) getter used by __get__ in sync with fget.
+        self._fget = fget
+        self._getter = _attrgetter_for(fget) or fget
+
+    @property
+    def name(self):
+        return self.fget.__name__
+
+    @property
+    def doc(self):
+        """The property's documentation: the ``doc`` argument, else the getter's docstring."""
+        return self._doc
 
     def __get__(self, instance, owner=None):
-        cls = owner or (type(instance) if instance is not None else None)
-        if cls is None:
-            raise RuntimeError(f"class property '{self.name}' accessed with no owner")
-        return self.fget(cls)
+        # Attribute access always passes owner; only manual __get__(obj) calls take the slow branch.
+        if owner is None:
+            owner = type(instance) if instance is not None else None
+            if owner is None:
+                raise RuntimeError(_NO_OWNER_MSG.format(self.fget.__qualname__))
+        return self._getter(owner)
 
     def __set__(self, instance, value):
-        raise AttributeError(
-            f"class property '{self.name}' is read-only",
-        )
+        raise AttributeError(_READ_ONLY_MSG.format(self.fget.__qualname__))
 
     def __delete__(self, instance):
-        raise AttributeError(
-            f"class property '{self.name}' is read-only",
-        )
+        raise AttributeError(_READ_ONLY_MSG.format(self.fget.__qualname__))
 
 
 class cached_class_property(Generic[T, R]):
@@ -72,6 +130,10 @@ class cached_class_property(Generic[T, R]):
       next access recomputes and recaches it.
     - ``instance.prop = value`` updates the cached value for the owner class.
 
+    On a cache miss the value is written with ``type.__setattr__`` directly, bypassing any ``__setattr__`` override on
+    the owner's metaclass; the cache attribute name is private to this descriptor. The explicit ``set`` helper and
+    ``instance.prop = value`` still go through regular ``setattr``.
+
     Note:
         - Assignment on the *class* (``MyClass.prop = value``) will overwrite
           this descriptor at the language level and is not supported.
@@ -79,33 +141,36 @@ class cached_class_property(Generic[T, R]):
           this descriptor entirely at the language level and is unsupported.
     """
 
-    __slots__ = ('func', '_cache_name', 'name')
+    __slots__ = ('func', '_cache_name')
 
     def __init__(self, func):
         self.func = func
-        self._cache_name = f'__cachedclassprop_{func.__name__}'
-        self.name: str | None = None
+        self._cache_name = sys.intern(_CACHE_NAME_PREFIX + func.__name__)
 
-    def __set_name__(self, owner, name):
-        self.name = name
+    @property
+    def name(self):
+        return self.func.__name__
 
     def _get_owner(self, instance, owner):
-        if owner is not None:
-            return owner
-        if instance is not None:
+        # Kept for compatibility; __get__ inlines this to avoid a method call per access.
+        if owner is None and instance is not None:
             return type(instance)
-        return None
+        return owner
 
     def __get__(self, instance, owner=None):
-        cls = self._get_owner(instance, owner)
+        cls = owner
         if cls is None:
-            raise RuntimeError('cached_class_property accessed with no owner')
-        try:
-            return cls.__dict__[self._cache_name]
-        except KeyError:
-            value = self.func(cls)
-            setattr(cls, self._cache_name, value)
+            cls = type(instance) if instance is not None else None
+            if cls is None:
+                raise RuntimeError('cached_class_property accessed with no owner')
+        cache_name = self._cache_name
+        d = cls.__dict__
+        value = d.get(cache_name, _MISSING)
+        if value is not _MISSING:
             return value
+        value = self.func(cls)
+        type.__setattr__(cls, cache_name, value)
+        return value
 
     def __set__(self, instance, value):
         """Directly update the cached value via an instance.
@@ -114,10 +179,7 @@ class cached_class_property(Generic[T, R]):
         ``MyClass.prop = value`` overwrites the descriptor and must be avoided.
         """
         if instance is None:
-            raise AttributeError(
-                f"cached_class_property '{self.name}' cannot be set on the class; "
-                'set it via an instance or explicit API instead',
-            )
+            raise AttributeError(_SET_ON_CLASS_MSG.format(self.func.__qualname__))
         cls = type(instance)
         setattr(cls, self._cache_name, value)
 
@@ -128,10 +190,7 @@ class cached_class_property(Generic[T, R]):
         access recomputes and recaches it.
         """
         if instance is None:
-            raise AttributeError(
-                f"cached_class_property '{self.name}' cannot be deleted on the class; "
-                'delete it via an instance or explicit API instead',
-            )
+            raise AttributeError(_DELETE_ON_CLASS_MSG.format(self.func.__qualname__))
         cls = type(instance)
         try:
             delattr(cls, self._cache_name)
@@ -151,53 +210,91 @@ class cached_class_property(Generic[T, R]):
         setattr(owner, self._cache_name, value)
 
 
+class single_thread_cached_class_property(cached_class_property[T, R]):
+    """Explicitly non-threadsafe; fastest possible cached class property.
+
+    Behaves exactly like cached_class_property, with no lock and no atomic operations on any path. The name documents
+    the contract at the call site: callers guarantee the cache is populated, set, and invalidated from a single thread.
+    Prefer it over threadsafe_cached_class_property wherever that guarantee holds.
+    """
+
+    __slots__ = ()
+
+
 class threadsafe_cached_class_property(cached_class_property[T, R]):
     """Thread-safe variant of cached_class_property.
 
-    Uses an RLock around get, set, delete, and the explicit helper methods. This prevents race conditions on cache
-    access but may incur a small performance penalty. Use only if you absolutely require a single getter execution within
-    a multithreaded environment.
+    Uses a per-owner-class lock around cache population, set, delete, and the explicit helper methods. Reads of an
+    already cached value do not take the lock, and populating the cache on one class never blocks another class sharing
+    the descriptor through inheritance. This prevents race conditions on cache access but may incur a small performance
+    penalty on a miss. Use only if you absolutely require a single getter execution within a multithreaded environment.
+
+    The locks are not reentrant: a getter that reads this same property on its own class while it is being computed
+    blocks forever instead of raising ``RecursionError``. Reading it on a parent class is fine, since that takes the
+    parent's lock.
+
+    Each class's lock is stored in that class's own ``__dict__`` under a private name, so locks are keyed by class
+    identity and never depend on a metaclass's ``__eq__``/``__hash__``.
+
+    Pass ``race_ok=True`` for idempotent getters to skip the lock on a miss entirely. In that mode the getter may be
+    invoked more than once when threads race on first access; only one result is cached, since publishing the value on
+    the class is a single atomic assignment. Set, delete, and the explicit helper methods still take the lock.
     """
 
-    __slots__ = ('_lock',)
+    __slots__ = ('_lock_name', '_locks_guard', '_race_ok')
 
-    def __init__(self, func):
+    def __init__(self, func, *, race_ok=False):
         super().__init__(func)
-        self._lock = threading.RLock()
+        self._race_ok = race_ok
+        self._lock_name = sys.intern(self._cache_name + '_lock')
+        self._locks_guard = threading.Lock()
+
+    def _lock_for(self, cls):
+        lock = cls.__dict__.get(self._lock_name)
+        if lock is None:
+            with self._locks_guard:
+                lock = cls.__dict__.get(self._lock_name)
+                if lock is None:
+                    lock = threading.Lock()
+                    type.__setattr__(cls, self._lock_name, lock)
+        return lock
 
     def __get__(self, instance, owner=None):
-        cls = self._get_owner(instance, owner)
+        cls = owner
         if cls is None:
-            raise RuntimeError('cached_class_property accessed with no owner')
-        try:
-            return cls.__dict__[self._cache_name]
-        except KeyError:
-            with self._lock:
-                try:
-                    return cls.__dict__[self._cache_name]
-                except KeyError:
-                    value = self.func(cls)
-                    setattr(cls, self._cache_name, value)
-                    return value
+            cls = type(instance) if instance is not None else None
+            if cls is None:
+                raise RuntimeError('cached_class_property accessed with no owner')
+        cache_name = self._cache_name
+        # The mappingproxy is a live view of the class dict, so one binding serves both checks.
+        d = cls.__dict__
+        value = d.get(cache_name, _MISSING)
+        if value is not _MISSING:
+            return value
+        if self._race_ok:
+            value = self.func(cls)
+            type.__setattr__(cls, cache_name, value)
+            return value
+        with self._lock_for(cls):
+            value = d.get(cache_name, _MISSING)
+            if value is not _MISSING:
+                return value
+            value = self.func(cls)
+            type.__setattr__(cls, cache_name, value)
+            return value
 
     def __set__(self, instance, value):
         if instance is None:
-            raise AttributeError(
-                f"cached_class_property '{self.name}' cannot be set on the class; "
-                'set it via an instance or explicit API instead',
-            )
+            raise AttributeError(_SET_ON_CLASS_MSG.format(self.func.__qualname__))
         cls = type(instance)
-        with self._lock:
+        with self._lock_for(cls):
             setattr(cls, self._cache_name, value)
 
     def __delete__(self, instance):
         if instance is None:
-            raise AttributeError(
-                f"cached_class_property '{self.name}' cannot be deleted on the class; "
-                'delete it via an instance or explicit API instead',
-            )
+            raise AttributeError(_DELETE_ON_CLASS_MSG.format(self.func.__qualname__))
         cls = type(instance)
-        with self._lock:
+        with self._lock_for(cls):
             try:
                 delattr(cls, self._cache_name)
             except AttributeError:
@@ -205,7 +302,7 @@ class threadsafe_cached_class_property(cached_class_property[T, R]):
 
     def invalidate(self, owner):
         """Thread-safe invalidation of the cached value for a given owner class."""
-        with self._lock:
+        with self._lock_for(owner):
             try:
                 delattr(owner, self._cache_name)
             except AttributeError:
@@ -213,5 +310,55 @@ class threadsafe_cached_class_property(cached_class_property[T, R]):
 
     def set(self, owner, value):
         """Thread-safe setter for the cached value for a given owner class."""
-        with self._lock:
+        with self._lock_for(owner):
             setattr(owner, self._cache_name, value)
+
+
+def _cached_class_properties(cls):
+    """Return ``(name, descriptor)`` for each cached_class_property visible on ``cls``, honouring MRO shadowing."""
+    seen = set()
+    found = []
+    for klass in cls.__mro__:
+        for name, attr in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if isinstance(attr, cached_class_property):
+                found.append((name, attr))
+    return found
+
+
+def _frozen_getter(func, value):
+    @wraps(func)
+    def getter(cls):
+        return value
+
+    return getter
+
+
+def freeze_cached_properties(cls):
+    """Class decorator that eagerly populates every cached_class_property of ``cls``.
+
+    Each descriptor visible on the class, including inherited ones, is evaluated once for ``cls`` at decoration time,
+    so the first read at runtime already hits the cache. This gives up lazy evaluation: getters run when the class is
+    defined. Values already cached for ``cls`` are kept. Set, delete, and invalidation keep working as usual; subclasses
+    are not frozen unless decorated themselves.
+    """
+    for _name, prop in _cached_class_properties(cls):
+        prop.__get__(None, cls)
+    return cls
+
+
+def freeze_cached_properties_strict(cls):
+    """Like freeze_cached_properties, then replace each descriptor on ``cls`` with a class_property of its value.
+
+    This saves even the cache lookup on later accesses, at the cost of the cached-property API: the property becomes
+    read-only (instance set/delete raise ``AttributeError``) and subclasses inherit the frozen value instead of
+    computing their own.
+    """
+    frozen = [(name, prop, prop.__get__(None, cls)) for name, prop in _cached_class_properties(cls)]
+    for name, prop, value in frozen:
+        # The descriptor is shadowed on cls from here on; drop its now unreachable cache entry.
+        prop.invalidate(cls)
+        setattr(cls, name, class_property(_frozen_getter(prop.func, value)))
+    return cls
@@ -1,4 +1,19 @@
-from class_properties import class_property, cached_class_property
+import gc
+import threading
+import weakref
+from operator import attrgetter
+
+import pytest
+
+from class_properties import (
+    cached_class_property,
+    class_property,
+    freeze_cached_properties,
+    freeze_cached_properties_strict,
+    single_thread_cached_class_property,
+    threadsafe_cached_class_property,
+)
+
 
 class Example:
     value=2
@@ -17,3 +32,143 @@ class Cached:
 def test_cached():
     assert Cached.val==1
     assert Cached.val==1
+
+class LockBase:
+    @threadsafe_cached_class_property
+    def depth(cls):
+        return 0 if cls is LockBase else cls.__mro__[1].depth + 1
+
+class LockChild(LockBase):
+    pass
+
+def test_threadsafe_subclass_reads_parent_during_population():
+    assert LockChild.depth==1
+    assert LockBase.depth==0
+
+class UnhashableMeta(type):
+    def __eq__(cls, other): return cls is other
+
+class Unhashable(metaclass=UnhashableMeta):
+    @threadsafe_cached_class_property
+    def val(cls): return 'ok'
+
+def test_threadsafe_unhashable_metaclass():
+    assert Unhashable.val=='ok'
+    del Unhashable().val
+    assert Unhashable().val=='ok'
+
+class RaceOk:
+    calls=[]
+    barrier=threading.Barrier(2, timeout=5)
+    def _settings(cls):
+        cls.calls.append(1)
+        cls.barrier.wait()
+        return {'debug': False}
+    settings=threadsafe_cached_class_property(_settings, race_ok=True)
+
+def test_threadsafe_race_ok():
+    results=[]
+    threads=[threading.Thread(target=lambda: results.append(RaceOk.settings)) for _ in range(2)]
+    [t.start() for t in threads]
+    [t.join() for t in threads]
+    assert len(RaceOk.calls)==2
+    assert len(results)==2 and results[0] is not results[1]
+    assert any(r is RaceOk.settings for r in results)
+    assert RaceOk.__dict__['settings']._lock_name not in vars(RaceOk)
+
+class Threshold:
+    _threshold=10
+    @class_property
+    def threshold(cls): return cls._threshold
+
+class LowThreshold(Threshold):
+    _threshold=1
+
+def test_cp_trivial_attribute_getter():
+    assert Threshold.threshold==10
+    assert LowThreshold().threshold==1
+    assert Threshold.__dict__['threshold'].fget(LowThreshold)==1
+    assert isinstance(Threshold.__dict__['threshold']._getter, attrgetter)
+
+def test_cp_non_trivial_getter_not_specialized():
+    for fget in (Example.__dict__['doubled'].fget, lambda cls: cls.x.y, lambda cls: cls.x()):
+        prop=class_property(fget)
+        assert prop._getter is fget
+
+def test_cp_fget_reassignment():
+    class Reassigned:
+        a=1
+        @class_property
+        def v(cls): return cls.a
+    assert Reassigned.v==1
+    Reassigned.__dict__['v'].fget=lambda cls: 2
+    assert Reassigned.v==2
+    Reassigned.__dict__['v'].fget=Example.__dict__['doubled'].fget
+    Reassigned.value=5
+    assert Reassigned().v==10
+
+def test_cp_read_only():
+    with pytest.raises(AttributeError, match='Example.doubled'):
+        Example().doubled=5
+    assert Example.__dict__['doubled'].name=='doubled'
+
+def test_cp_doc():
+    def documented(cls):
+        """Getter docstring."""
+        return 1
+    assert class_property(documented).doc=='Getter docstring.'
+    assert class_property(documented, doc='Explicit.').doc=='Explicit.'
+    assert Example.__dict__['doubled'].doc is None
+
+class SingleThread:
+    counter=0
+    @single_thread_cached_class_property
+    def val(cls):
+        cls.counter+=1
+        return cls.counter
+
+def test_single_thread_cached():
+    assert SingleThread.val==1
+    assert SingleThread().val==1
+    del SingleThread().val
+    assert SingleThread.val==2
+
+def test_cached_value_referencing_class_is_collectable():
+    class Base:
+        @cached_class_property
+        def inst(cls): return cls()
+
+    Sub=type('Sub', (Base,), {})
+    assert type(Sub.inst) is Sub
+    ref=weakref.ref(Sub)
+    del Sub
+    gc.collect()
+    assert ref() is None
+
+class FrozenBase:
+    calls=0
+    @cached_class_property
+    def val(cls):
+        FrozenBase.calls+=1
+        return cls.__name__
+
+@freeze_cached_properties
+class Frozen(FrozenBase):
+    pass
+
+@freeze_cached_properties_strict
+class FrozenStrict(FrozenBase):
+    pass
+
+def test_freeze_cached_properties():
+    assert FrozenBase.calls==2
+    assert Frozen.val=='Frozen'
+    assert FrozenStrict().val=='FrozenStrict'
+    assert FrozenBase.calls==2
+    assert isinstance(FrozenStrict.__dict__['val'], class_property)
+    assert not any(k.startswith('__cachedclassprop') for k in vars(FrozenStrict))
+    with pytest.raises(AttributeError):
+        FrozenStrict().val='x'
+    del Frozen().val
+    assert Frozen.val=='Frozen'
+    assert FrozenBase.calls==3